@@ -106,9 +106,9 @@ class Virus:
             replicator=self.replicator,
             adapt=self.adapt,
             mirror=self.mirror,
+            mimicked_name=self.mimicked_name,
+            adaptation_bonus=self.adaptation_bonus * 0.5,
         )
-        clone.adaptation_bonus = self.adaptation_bonus * 0.5
-        clone.mimicked_name = self.mimicked_name
         clone.origin_name = self.origin_name
         return clone
 
@@ -123,7 +123,7 @@ class Virus:
             return []
 
         events: List[str] = []
-        healthy_processes = [p for p in world.processes if not p.compromised]
+        healthy_processes = world._healthy_processes()
         if healthy_processes:
             target = rng.choice(healthy_processes)
             infection_chance = 0.35 + 0.25 * (1.0 - target.stability)
@@ -136,7 +136,7 @@ class Virus:
                 self.mimicked_name = target.name
 
             if rng.random() < infection_chance:
-                target.compromised = True
+                world._set_compromised(target, True)
                 events.append(
                     f"{self.name} compromised {target.name} (chance {infection_chance:.2f})."
                 )
@@ -167,13 +167,13 @@ class Antivirus:
         """Perform scanning and optional repairs."""
 
         events: List[str] = []
-        active_viruses = [v for v in world.viruses if v.active]
+        active_viruses = world._active_viruses()
         if active_viruses:
             target = rng.choice(active_viruses)
             detection_chance = max(0.05, self.detection_rate * target.detection_difficulty())
             roll = rng.random()
             if roll < detection_chance:
-                target.active = False
+                world._neutralize(target)
                 target.on_detection_attempt(success=True)
                 events.append(
                     f"{self.name} neutralized {target.name} (chance {detection_chance:.2f})."
@@ -184,10 +184,10 @@ class Antivirus:
                     f"{self.name} scanned {target.name} but missed (roll {roll:.2f} vs {detection_chance:.2f})."
                 )
 
-        compromised = [p for p in world.processes if p.compromised]
+        compromised = world._compromised_processes()
         if compromised and rng.random() < self.repair_rate:
             repaired = rng.choice(compromised)
-            repaired.compromised = False
+            world._set_compromised(repaired, False)
             events.append(f"{self.name} repaired {repaired.name}.")
 
         return events
@@ -214,6 +214,11 @@ class World:
         self._pending_viruses: List[Virus] = []
         self._clone_counter = 0
         self.max_viruses = max_viruses
+        # Per-turn views of the mutable state, only kept while step() runs.
+        self._in_turn = False
+        self._healthy: Optional[List[Process]] = None
+        self._compromised: Optional[List[Process]] = None
+        self._active: Optional[List[Virus]] = None
 
     @property
     def rng(self) -> random.Random:
@@ -221,6 +226,67 @@ class World:
 
         return self._rng
 
+    def _healthy_processes(self) -> List[Process]:
+        """Return the processes that are not compromised, in world order.
+
+        While :meth:`step` runs, the list is built on first use and reused for
+        the rest of the turn; outside a turn it is recomputed on every call.
+        Callers must not mutate the returned list.
+        """
+
+        healthy = self._healthy
+        if healthy is None:
+            healthy = [p for p in self.processes if not p.compromised]
+            if self._in_turn:
+                self._healthy = healthy
+        return healthy
+
+    def _compromised_processes(self) -> List[Process]:
+        """Return the compromised processes, in world order (turn-scoped)."""
+
+        compromised = self._compromised
+        if compromised is None:
+            compromised = [p for p in self.processes if p.compromised]
+            if self._in_turn:
+                self._compromised = compromised
+        return compromised
+
+    def _active_viruses(self) -> List[Virus]:
+        """Return the active viruses, in world order (turn-scoped)."""
+
+        active = self._active
+        if active is None:
+            active = [v for v in self.viruses if v.active]
+            if self._in_turn:
+                self._active = active
+        return active
+
+    def _set_compromised(self, process: Process, compromised: bool) -> None:
+        """Change a process state and keep the per-turn lists in sync."""
+
+        if process.compromised == compromised:
+            return
+        process.compromised = compromised
+        if self._healthy is not None:
+            if compromised:
+                self._healthy.remove(process)
+            else:
+                self._healthy = None
+        if self._compromised is not None:
+            if compromised:
+                self._compromised = None
+            else:
+                self._compromised.remove(process)
+
+    def _neutralize(self, virus: Virus) -> None:
+        """Deactivate ``virus`` and keep the per-turn active list in sync."""
+
+        if not virus.active:
+            return
+        virus.active = False
+        if self._active is not None:
+            self._active.remove(virus)
+
     def next_clone_id(self) -> int:
         """Return a unique identifier for clones."""
 
@@ -253,7 +319,9 @@ class World:
             if event:
                 turn_events.append(event)
 
-        # Viruses act next.
+        # Viruses act next. State changes go through _set_compromised and
+        # _neutralize from here on, so the per-turn lists stay accurate.
+        self._in_turn = True
         for virus in list(self.viruses):
             turn_events.extend(virus.step(self, self._rng))
 
@@ -261,10 +329,15 @@ class World:
         if self._pending_viruses:
             self.viruses.extend(self._pending_viruses)
             self._pending_viruses = []
+            self._active = None
 
         # Antivirus agents respond last.
         for agent in self.antivirus_agents:
             turn_events.extend(agent.step(self, self._rng))
+        self._in_turn = False
+        self._healthy = None
+        self._compromised = None
+        self._active = None
 
         self._event_log.append(turn_events)
         return turn_events
@@ -1,19 +1,153 @@
-"""Preset scenarios for the virus simulation game.
+"""Preset scenarios and batch runners for the virus simulation game.
 
 Every scenario is deterministic when provided with the same random seed and
 only uses the classes defined in :mod:`entities`. The scenarios demonstrate
 how different ability combinations play out purely as game mechanics.
+:func:`batch_runs` runs one scenario across many seeds, using worker
+processes for large sweeps.
 """
 from __future__ import annotations
 
+import os
 import random
-from typing import Callable, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from entities import Antivirus, Process, Virus, World
 
 # Type alias for scenario builders. Builders accept an optional seed.
 ScenarioBuilder = Callable[..., World]
 
+# Below this many simulated turns in total (worlds x turns) a batch runs
+# in-process, because worker start-up would cost more than it saves.
+PARALLEL_MIN_TURNS = 50_000
+
+
+class ProcessSpec(NamedTuple):
+    """Immutable description of a :class:`~entities.Process`."""
+
+    name: str
+    stability: float
+
+
+class AntivirusSpec(NamedTuple):
+    """Immutable description of an :class:`~entities.Antivirus` agent."""
+
+    name: str
+    detection_rate: float
+    repair_rate: float
+
+
+class VirusSpec(NamedTuple):
+    """Immutable description of a :class:`~entities.Virus` and its abilities."""
+
+    name: str
+    camouflage: bool = False
+    replicator: bool = False
+    adapt: bool = False
+    mirror: bool = False
+
+
+class ShowcaseCase(NamedTuple):
+    """One deterministic ability showcase run."""
+
+    label: str
+    virus: VirusSpec
+    antivirus: Tuple[AntivirusSpec, ...]
+    processes: Tuple[ProcessSpec, ...]
+    seed: int
+    turns: int
+
+
+# Immutable scenario tables built once at import time. Entities are mutable,
+# so builders turn these into fresh instances on every call.
+_BASIC_PROCESSES = (
+    ProcessSpec("DrawingApp", stability=0.9),
+    ProcessSpec("MusicPlayer", stability=0.8),
+    ProcessSpec("PhotoOrganizer", stability=0.7),
+    ProcessSpec("Spreadsheet", stability=0.85),
+    ProcessSpec("NoteTaker", stability=0.95),
+)
+_BASIC_VIRUS = VirusSpec(
+    "Edu-Virus",
+    camouflage=True,
+    replicator=True,
+    adapt=True,
+    mirror=False,
+)
+_BASIC_ANTIVIRUS = (AntivirusSpec("ShieldOne", detection_rate=0.55, repair_rate=0.25),)
+
+_STEALTH_PROCESSES = (
+    ProcessSpec("ChatApp", stability=0.8),
+    ProcessSpec("Calendar", stability=0.85),
+    ProcessSpec("ArcadeGame", stability=0.75),
+    ProcessSpec("PhotoEditor", stability=0.7),
+)
+_STEALTH_VIRUS = VirusSpec("Shadow", camouflage=True, replicator=False, adapt=True, mirror=True)
+_STEALTH_ANTIVIRUS = (
+    AntivirusSpec("Watcher", detection_rate=0.65, repair_rate=0.3),
+    AntivirusSpec("Guardian", detection_rate=0.5, repair_rate=0.2),
+)
+
+_REPLICATION_PROCESSES = (
+    ProcessSpec("Mail", stability=0.9),
+    ProcessSpec("Presentation", stability=0.75),
+    ProcessSpec("IDE", stability=0.8),
+    ProcessSpec("ImageViewer", stability=0.85),
+    ProcessSpec("Browser", stability=0.7),
+    ProcessSpec("GameLauncher", stability=0.65),
+)
+_REPLICATION_VIRUS = VirusSpec(
+    "Hydra", camouflage=False, replicator=True, adapt=False, mirror=False
+)
+_REPLICATION_ANTIVIRUS = (AntivirusSpec("RapidScan", detection_rate=0.6, repair_rate=0.35),)
+
+_SHOWCASE_CASES = (
+    ShowcaseCase(
+        label="Camouflage + Adapt",
+        virus=VirusSpec(
+            "StudyCase-Stealth", camouflage=True, adapt=True, replicator=False, mirror=False
+        ),
+        antivirus=(AntivirusSpec("Analyst", detection_rate=0.5, repair_rate=0.2),),
+        processes=(
+            ProcessSpec("Writer", stability=0.9),
+            ProcessSpec("Painter", stability=0.85),
+            ProcessSpec("Composer", stability=0.8),
+        ),
+        seed=15,
+        turns=13,
+    ),
+    ShowcaseCase(
+        label="Replicator only",
+        virus=VirusSpec(
+            "StudyCase-Rep", camouflage=False, adapt=False, replicator=True, mirror=False
+        ),
+        antivirus=(AntivirusSpec("Responder", detection_rate=0.55, repair_rate=0.25),),
+        processes=(
+            ProcessSpec("Planner", stability=0.9),
+            ProcessSpec("Editor", stability=0.8),
+            ProcessSpec("Sketch", stability=0.7),
+            ProcessSpec("Rhythm", stability=0.75),
+        ),
+        seed=12,
+        turns=21,
+    ),
+    ShowcaseCase(
+        label="Mirror + Camouflage",
+        virus=VirusSpec(
+            "StudyCase-Mirror", camouflage=True, adapt=False, replicator=False, mirror=True
+        ),
+        antivirus=(AntivirusSpec("Observer", detection_rate=0.65, repair_rate=0.3),),
+        processes=(
+            ProcessSpec("MailClient", stability=0.9),
+            ProcessSpec("VideoCall", stability=0.85),
+            ProcessSpec("PuzzleGame", stability=0.8),
+        ),
+        seed=10,
+        turns=9,
+    ),
+)
+
 
 def _build_world(
     *,
@@ -28,60 +162,49 @@ def _build_world(
     return World(processes=processes, antivirus_agents=antivirus, viruses=[virus], rng=rng)
 
 
+def _world_from_specs(
+    seed: int,
+    virus: VirusSpec,
+    antivirus: Tuple[AntivirusSpec, ...],
+    processes: Tuple[ProcessSpec, ...],
+) -> World:
+    """Instantiate fresh entities from the immutable tables and build a world."""
+
+    return _build_world(
+        rng_seed=seed,
+        virus=Virus(
+            virus.name,
+            camouflage=virus.camouflage,
+            replicator=virus.replicator,
+            adapt=virus.adapt,
+            mirror=virus.mirror,
+        ),
+        antivirus=[
+            Antivirus(a.name, detection_rate=a.detection_rate, repair_rate=a.repair_rate)
+            for a in antivirus
+        ],
+        processes=[Process(p.name, stability=p.stability) for p in processes],
+    )
+
+
 def basic_scenario(seed: int = 42) -> World:
     """A gentle starting scenario for demonstrations."""
 
-    processes = [
-        Process("DrawingApp", stability=0.9),
-        Process("MusicPlayer", stability=0.8),
-        Process("PhotoOrganizer", stability=0.7),
-        Process("Spreadsheet", stability=0.85),
-        Process("NoteTaker", stability=0.95),
-    ]
-    virus = Virus(
-        "Edu-Virus",
-        camouflage=True,
-        replicator=True,
-        adapt=True,
-        mirror=False,
-    )
-    antivirus = [Antivirus("ShieldOne", detection_rate=0.55, repair_rate=0.25)]
-    return _build_world(rng_seed=seed, virus=virus, antivirus=antivirus, processes=processes)
+    return _world_from_specs(seed, _BASIC_VIRUS, _BASIC_ANTIVIRUS, _BASIC_PROCESSES)
 
 
 def stealth_showcase(seed: int = 7) -> World:
     """Showcase high stealth and mimicry versus rapid antivirus scans."""
 
-    processes = [
-        Process("ChatApp", stability=0.8),
-        Process("Calendar", stability=0.85),
-        Process("ArcadeGame", stability=0.75),
-        Process("PhotoEditor", stability=0.7),
-    ]
-    virus = Virus("Shadow", camouflage=True, replicator=False, adapt=True, mirror=True)
-    antivirus = [
-        Antivirus("Watcher", detection_rate=0.65, repair_rate=0.3),
-        Antivirus("Guardian", detection_rate=0.5, repair_rate=0.2),
-    ]
-    return _build_world(rng_seed=seed, virus=virus, antivirus=antivirus, processes=processes)
+    return _world_from_specs(seed, _STEALTH_VIRUS, _STEALTH_ANTIVIRUS, _STEALTH_PROCESSES)
 
 
 def replication_showcase(seed: int = 99) -> World:
     """Show how replication increases pressure on the defenders."""
 
-    processes = [
-        Process("Mail", stability=0.9),
-        Process("Presentation", stability=0.75),
-        Process("IDE", stability=0.8),
-        Process("ImageViewer", stability=0.85),
-        Process("Browser", stability=0.7),
-        Process("GameLauncher", stability=0.65),
-    ]
-    virus = Virus("Hydra", camouflage=False, replicator=True, adapt=False, mirror=False)
-    antivirus = [
-        Antivirus("RapidScan", detection_rate=0.6, repair_rate=0.35),
-    ]
-    return _build_world(rng_seed=seed, virus=virus, antivirus=antivirus, processes=processes)
+    return _world_from_specs(
+        seed, _REPLICATION_VIRUS, _REPLICATION_ANTIVIRUS, _REPLICATION_PROCESSES
+    )
 
 
 SCENARIOS: Dict[str, ScenarioBuilder] = {
@@ -94,50 +217,46 @@ SCENARIOS: Dict[str, ScenarioBuilder] = {
 def showcase_runs() -> List[Tuple[str, str, str]]:
     """Return deterministic summaries for different ability combinations."""
 
-    cases = [
-        (
-            "Camouflage + Adapt",
-            Virus("StudyCase-Stealth", camouflage=True, adapt=True, replicator=False, mirror=False),
-            [Antivirus("Analyst", detection_rate=0.5, repair_rate=0.2)],
-            [
-                Process("Writer", stability=0.9),
-                Process("Painter", stability=0.85),
-                Process("Composer", stability=0.8),
-            ],
-            15,
-            13,
-        ),
-        (
-            "Replicator only",
-            Virus("StudyCase-Rep", camouflage=False, adapt=False, replicator=True, mirror=False),
-            [Antivirus("Responder", detection_rate=0.55, repair_rate=0.25)],
-            [
-                Process("Planner", stability=0.9),
-                Process("Editor", stability=0.8),
-                Process("Sketch", stability=0.7),
-                Process("Rhythm", stability=0.75),
-            ],
-            12,
-            21,
-        ),
-        (
-            "Mirror + Camouflage",
-            Virus("StudyCase-Mirror", camouflage=True, adapt=False, replicator=False, mirror=True),
-            [Antivirus("Observer", detection_rate=0.65, repair_rate=0.3)],
-            [
-                Process("MailClient", stability=0.9),
-                Process("VideoCall", stability=0.85),
-                Process("PuzzleGame", stability=0.8),
-            ],
-            10,
-            9,
-        ),
-    ]
-
+    explanation = World.game_explanation()
     summaries: List[Tuple[str, str, str]] = []
-    for label, virus, av, processes, seed, turns in cases:
-        world = _build_world(rng_seed=seed, virus=virus, antivirus=av, processes=processes)
-        world.run(turns)
-        summaries.append((label, world.summary(), World.game_explanation()))
+    for case in _SHOWCASE_CASES:
+        world = _world_from_specs(case.seed, case.virus, case.antivirus, case.processes)
+        world.run(case.turns)
+        summaries.append((case.label, world.summary(), explanation))
     return summaries
 
+
+def _run_seeded(job: Tuple[str, int, int]) -> Tuple[int, str]:
+    """Build and run one scenario world; module-level so it can be pickled."""
+
+    name, seed, turns = job
+    world = SCENARIOS[name](seed)
+    world.run(turns)
+    return seed, world.summary()
+
+
+def batch_runs(
+    name: str,
+    seeds: Iterable[int],
+    turns: int,
+    *,
+    workers: Optional[int] = None,
+) -> List[Tuple[int, str]]:
+    """Run one scenario for many seeds, in parallel worker processes if useful.
+
+    Each world is independent, so a sweep over seeds spreads across CPU cores.
+    Results are returned in seed order and match running each seed on its
+    own. ``workers=1`` runs everything in the current process. With the
+    default ``workers=None`` the batch also stays in-process on single-CPU
+    machines or when it totals fewer than :data:`PARALLEL_MIN_TURNS` turns.
+    """
+
+    jobs = [(name, seed, turns) for seed in seeds]
+    if workers is None and (
+        (os.cpu_count() or 1) <= 1 or len(jobs) * turns < PARALLEL_MIN_TURNS
+    ):
+        workers = 1
+    if workers == 1 or len(jobs) <= 1:
+        return [_run_seeded(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_seeded, jobs, chunksize=max(1, len(jobs) // 32)))
@@ -7,10 +7,23 @@ interacts with the real filesystem, network, or system processes. The
 from __future__ import annotations
 
 import argparse
-from typing import Optional
+import sys
+from typing import List, Optional
 
 from entities import World
-from scenarios import SCENARIOS, showcase_runs
+from scenarios import SCENARIOS, batch_runs, showcase_runs
+
+# Number of turns whose events are buffered before a single write to stdout.
+EVENT_FLUSH_TURNS = 64
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type that accepts integers greater than zero."""
+
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,12 +61,36 @@ def parse_args() -> argparse.Namespace:
             " different virus abilities."
         ),
     )
+    parser.add_argument(
+        "--batch",
+        type=_positive_int,
+        default=None,
+        metavar="COUNT",
+        help=(
+            "Run COUNT seeded worlds (seeds start at --seed, or 0) and print"
+            " only their summaries; see --workers."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help=(
+            "Worker processes for --batch (1 runs in-process). By default small"
+            " batches run in-process and larger ones use every CPU."
+        ),
+    )
     parser.add_argument(
         "--no-explanation",
         action="store_true",
         help="Skip printing the ability explanation text.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.batch is not None and args.showcase:
+        parser.error("--batch cannot be combined with --showcase")
+    if args.workers is not None and args.batch is None:
+        parser.error("--workers requires --batch")
+    return args
 
 
 def build_world(name: str, seed: Optional[int]) -> World:
@@ -68,14 +105,26 @@ def build_world(name: str, seed: Optional[int]) -> World:
 def run_world(world: World, turns: int, *, print_events: bool = True) -> None:
     """Advance the world a number of turns, optionally printing events."""
 
-    for _ in range(turns):
+    pending: List[str] = []
+    for turn in range(1, turns + 1):
         events = world.step()
         if print_events:
-            for entry in events:
-                print(entry)
+            pending.extend(events)
+            if turn % EVENT_FLUSH_TURNS == 0:
+                _write_lines(pending)
+                pending.clear()
+    _write_lines(pending)
     print(world.summary())
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered event lines to stdout in one call."""
+
+    if lines:
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
+
+
 def run_showcase() -> None:
     """Execute deterministic runs that act like unit tests for abilities."""
 
@@ -87,6 +136,25 @@ def run_showcase() -> None:
         print()
 
 
+def run_batch(
+    name: str,
+    count: int,
+    first_seed: int,
+    turns: int,
+    *,
+    workers: Optional[int] = None,
+) -> None:
+    """Print summaries for ``count`` consecutive seeds of one scenario."""
+
+    noun = "world" if count == 1 else "worlds"
+    print(f"Running {count} {noun} of scenario '{name}'...")
+    seeds = range(first_seed, first_seed + count)
+    for seed, summary in batch_runs(name, seeds, turns, workers=workers):
+        print(f"== Seed {seed} ==")
+        print(summary.strip())
+        print()
+
+
 def main() -> None:
     args = parse_args()
 
@@ -94,6 +162,10 @@ def main() -> None:
         run_showcase()
         return
 
+    if args.batch is not None:
+        run_batch(args.scenario, args.batch, args.seed or 0, args.turns, workers=args.workers)
+        return
+
     world = build_world(args.scenario, args.seed)
 
     if not args.no_explanation: